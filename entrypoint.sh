@@ -1,10 +1,7 @@
 #\!/bin/sh
 set -e
 
-echo "==> 启动时更新 chinesecalendar 库..."
-pip install --upgrade --no-cache-dir chinese-calendar -q \
-    -i https://mirrors.aliyun.com/pypi/simple/ \
-    --trusted-host mirrors.aliyun.com
-echo "==> 更新完成，启动 API 服务..."
+# chinese-calendar 的更新由 updater 容器负责，API 启动时自动加载其下载的最新 wheel
+echo "==> 启动 API 服务..."
 
 exec uvicorn main:app --host 0.0.0.0 --port 8000
@@ -1,26 +1,32 @@
 """中国工作日校验 API"""
 
 import importlib
-import json
 import logging
-import subprocess
+import os
+import re
 import sys
+import tempfile
+import time
 from contextlib import asynccontextmanager
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import chinese_calendar
 import httpx
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from chinese_calendar import get_holiday_detail, is_workday
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field
 
+# 接口直接返回 CJKResponse（或预编码的 Response），FastAPI 不再对返回值做
+# jsonable_encoder 递归转换，因此内容必须只包含 JSON 原生类型；也不要声明 response_model
 class CJKResponse(JSONResponse):
     media_type = "application/json; charset=utf-8"
 
     def render(self, content) -> bytes:
-        return json.dumps(content, ensure_ascii=False).encode("utf-8")
+        return orjson.dumps(content)
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -29,39 +35,98 @@ logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path("/app/cache")
 CACHE_FILE = CACHE_DIR / "holidays_cache.json"
+# updater 容器下载的 chinese-calendar wheel，只读挂载
+WHEEL_DIR = Path("/app/wheels")
+# 中国不实行夏令时，固定 UTC+8
+CHINA_TZ = timezone(timedelta(hours=8))
 WEEKDAY_NAMES = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
+# 2026-02-25、2026_2_25、20260225、2026年2月25日，分隔符需前后一致。
+# 月、日沿用 strptime 中 %m、%d 的写法，接受的输入与原先逐个尝试格式时一致
+# （包括 "2026-1- 2" 这类空格补位的日、以及 \d 匹配到的全角等 Unicode 数字）；
+# 无分隔符时由正则回溯决定月、日的拆分，与 strptime 相同（如 2026225 -> 2-25）
+_MONTH_RE = r"(1[0-2]|0[1-9]|[1-9])"
+_DAY_RE = r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+_DATE_RE = re.compile(
+    rf"(\d{{4}})(?:([-_]?){_MONTH_RE}\2{_DAY_RE}|年{_MONTH_RE}月{_DAY_RE}日)"
+)
 
 # --- 辅助数据源 ---
 
 NAGER_API = "https://date.nager.at/api/v3/PublicHolidays/{year}/CN"
 
+# 辅助源数据的内存副本，按缓存文件 mtime 判断是否需要重新加载
+_CACHE: dict | None = None
+_CACHE_MTIME: float = 0.0
+# 辅助源假日的日期序数集合，按年份索引，供请求路径做成员判断
+_NAGER_SETS: dict[int, frozenset[int]] = {}
+
 
 def load_cache() -> dict:
     """加载本地缓存的辅助源数据"""
-    if CACHE_FILE.exists():
-        try:
-            return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            logger.warning("缓存文件读取失败，忽略")
+    try:
+        return orjson.loads(CACHE_FILE.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning("缓存文件读取失败，忽略")
     return {}
 
 
 def save_cache(data: dict):
     """保存辅助源数据到本地缓存"""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    CACHE_FILE.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    # 先写临时文件再原子替换，按 mtime 重新加载时不会读到写了一半的文件；
+    # 每个写入方使用独立的临时文件，多个 worker 同时保存也不会互相覆盖
+    tmp = tempfile.NamedTemporaryFile(
+        dir=CACHE_DIR, prefix=CACHE_FILE.name, suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(orjson.dumps(data))
+            tmp.flush()
+            # 取自己写入文件的 mtime（rename 不改变），避免读到其他 worker 刚替换的文件
+            mtime = os.fstat(tmp.fileno()).st_mtime
+        os.replace(tmp.name, CACHE_FILE)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    _set_cache(data, mtime)
+
+
+def _set_cache(data: dict, mtime: float):
+    """更新内存缓存，并同步重建辅助源日期集合"""
+    global _CACHE, _CACHE_MTIME, _NAGER_SETS
+    nager_sets = {}
+    for year, holidays in data.items():
+        try:
+            days = frozenset(date.fromisoformat(d).toordinal() for d in holidays)
+            if days:
+                nager_sets[int(year)] = days
+        except (TypeError, ValueError):
+            logger.warning("缓存中 %s 年数据格式错误，忽略", year)
+    _CACHE, _CACHE_MTIME, _NAGER_SETS = data, mtime, nager_sets
+
+
+def get_cache() -> dict:
+    """获取内存中的辅助源数据，仅在缓存文件变化时重新读取"""
+    try:
+        mtime = CACHE_FILE.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    if _CACHE is None or mtime != _CACHE_MTIME:
+        _set_cache(load_cache(), mtime)
+    return _CACHE
 
 
-async def fetch_nager_holidays(year: int) -> dict[str, str]:
+async def fetch_nager_holidays(year: int, client: httpx.AsyncClient) -> dict[str, str]:
     """从 Nager.Date 获取指定年份的中国公共假日"""
     result = {}
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(NAGER_API.format(year=year))
-            if resp.status_code == 200:
-                for item in resp.json():
-                    result[item["date"]] = item["localName"]
-                logger.info("Nager.Date %d 年数据获取成功，共 %d 条", year, len(result))
+        resp = await client.get(NAGER_API.format(year=year))
+        if resp.status_code == 200:
+            for item in resp.json():
+                result[item["date"]] = item["localName"]
+            logger.info("Nager.Date %d 年数据获取成功，共 %d 条", year, len(result))
     except Exception as e:
         logger.warning("Nager.Date 数据获取失败: %s", e)
     return result
@@ -70,39 +135,98 @@ async def fetch_nager_holidays(year: int) -> dict[str, str]:
 # --- 定时任务 ---
 
 
+# 当前使用的 wheel：(mtime, 路径)；None 表示使用镜像内安装的版本
+_WHEEL_STATE: tuple[float, str] | None = None
+# 导入失败的 wheel，不再重复尝试
+_FAILED_WHEELS: set[tuple[float, str]] = set()
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    """取版本号开头的数字部分用于比较，如 "1.11.0" -> (1, 11, 0)"""
+    m = re.match(r"\d+(?:\.\d+)*", version)
+    return tuple(int(part) for part in m[0].split(".")) if m else ()
+
+
+def reload_chinese_calendar():
+    """重新导入 chinesecalendar 及其子模块
+
+    仅 reload 包本身不会重新执行 constants 等子模块，新数据不会生效，
+    因此先从 sys.modules 中移除整个包再重新导入。
+    """
+    global chinese_calendar
+    for name in list(sys.modules):
+        if name == "chinese_calendar" or name.startswith("chinese_calendar."):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+    chinese_calendar = importlib.import_module("chinese_calendar")
+
+
+def _switch_wheel(old: str | None, new: str | None):
+    """把 sys.path 中的 wheel 从 old 换成 new 并重新导入 chinesecalendar"""
+    if old in sys.path:
+        sys.path.remove(old)
+    if new:
+        sys.path.insert(0, new)
+    reload_chinese_calendar()
+
+
 async def update_library():
-    """更新 chinesecalendar 库并重新加载"""
-    logger.info("开始定时更新 chinesecalendar...")
+    """检查共享目录中的 chinese-calendar wheel，有更高版本时切换导入路径并重新加载
+
+    wheel 由 updater 容器定期下载到 WHEEL_DIR，API 进程本身不再执行 pip。
+    chinese-calendar 是纯 Python 包，可以直接通过 zipimport 从 wheel 导入。
+    """
+    global _WHEEL_STATE
+    candidates = []
+    for path in WHEEL_DIR.glob("chinese_calendar-*.whl"):
+        try:
+            state = (path.stat().st_mtime, str(path))
+        except OSError:
+            continue
+        if state in _FAILED_WHEELS:
+            continue
+        # 文件名形如 chinese_calendar-1.11.0-py2.py3-none-any.whl
+        candidates.append((_version_tuple(path.name.split("-")[1]), state))
+    if not candidates:
+        return
+    version, state = max(candidates)
+    if state == _WHEEL_STATE:
+        return
+    # 只升级不降级：卷里残留的旧 wheel 不能覆盖镜像内更新的版本
+    if version <= _version_tuple(chinese_calendar.__version__):
+        return
+
+    previous = _WHEEL_STATE[1] if _WHEEL_STATE else None
+    wheel_path = state[1]
+    logger.info("发现新的 chinesecalendar wheel: %s", wheel_path)
     try:
-        subprocess.check_call(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "--upgrade",
-                "--no-cache-dir",
-                "chinese-calendar",
-                "-q",
-                "-i",
-                "https://mirrors.aliyun.com/pypi/simple/",
-                "--trusted-host",
-                "mirrors.aliyun.com",
-            ]
-        )
-        importlib.reload(chinese_calendar)
-        logger.info("chinesecalendar 更新并重载完成")
+        _switch_wheel(previous, wheel_path)
+        # 损坏的 wheel 会被 sys.path 静默跳过，需确认确实是从 wheel 导入的
+        if not chinese_calendar.__file__.startswith(wheel_path):
+            raise ImportError(f"无法从 {wheel_path} 导入 chinese_calendar")
+        _WHEEL_STATE = state
     except Exception as e:
-        logger.error("更新失败: %s", e)
-
-
-async def update_auxiliary_cache():
+        logger.error("更新失败，忽略该 wheel: %s", e)
+        _FAILED_WHEELS.add(state)
+        # 回退到之前的 wheel；若它已被删除，则回退到镜像内安装的版本
+        if previous and not Path(previous).exists():
+            previous = None
+            _WHEEL_STATE = None
+        _switch_wheel(wheel_path, previous)
+    # 无论升级还是回退，模块都已重新导入，需要重建派生数据；
+    # 以下步骤均为同步执行，请求不会读到新旧数据混合的状态
+    clear_status_caches()
+    rebuild_status_table()
+    logger.info("chinesecalendar 重载完成，当前版本 %s", chinese_calendar.__version__)
+
+
+async def update_auxiliary_cache(client: httpx.AsyncClient):
     """更新辅助源缓存"""
     logger.info("开始更新辅助源缓存...")
-    current_year = date.today().year
-    cache = load_cache()
+    current_year = today().year
+    cache = dict(get_cache())
     for year in [current_year, current_year + 1]:
-        holidays = await fetch_nager_holidays(year)
+        holidays = await fetch_nager_holidays(year, client)
         if holidays:
             cache[str(year)] = holidays
     save_cache(cache)
@@ -111,31 +235,32 @@ async def update_auxiliary_cache():
 
 # --- 核心逻辑 ---
 
+# 缓存的"今天"，到北京时间下一个零点（按 monotonic 时钟）失效
+_TODAY_ORDINAL: int = 0
+_TODAY_EXPIRES: float = 0.0
+
+
+def today_ordinal() -> int:
+    """返回北京时间今天的日期序数，每天只计算一次"""
+    global _TODAY_ORDINAL, _TODAY_EXPIRES
+    now = time.monotonic()
+    if now >= _TODAY_EXPIRES:
+        current = datetime.now(CHINA_TZ)
+        midnight = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        _TODAY_ORDINAL = current.toordinal()
+        _TODAY_EXPIRES = now + (midnight + timedelta(days=1) - current).total_seconds()
+    return _TODAY_ORDINAL
 
-def find_next_rest_day(from_date: date, max_days: int = 30) -> dict | None:
-    """从指定日期开始，查找下一个休息日"""
-    for i in range(1, max_days + 1):
-        d = from_date + timedelta(days=i)
-        try:
-            if not is_workday(d):
-                on_holiday, holiday_name = get_holiday_detail(d)
-                return {
-                    "date": d.isoformat(),
-                    "weekday": WEEKDAY_NAMES[d.weekday()],
-                    "detail": holiday_name if on_holiday and holiday_name else "周末",
-                    "days_from_now": (d - date.today()).days,
-                }
-        except NotImplementedError:
-            break
-    return None
 
+def today() -> date:
+    return date.fromordinal(today_ordinal())
 
-def get_date_status(target_date: date) -> dict:
-    """获取指定日期的工作日状态"""
-    is_work = is_workday(target_date)
-    on_holiday, holiday_name = get_holiday_detail(target_date)
-    weekday = target_date.weekday()
-    weekday_name = WEEKDAY_NAMES[weekday]
+
+def _build_status_entry(d: date) -> tuple:
+    """计算某一天的状态表条目，超出 chinesecalendar 收录范围时抛出 NotImplementedError"""
+    is_work = chinese_calendar.is_workday(d)
+    on_holiday, holiday_name = chinese_calendar.get_holiday_detail(d)
+    weekday = d.weekday()
 
     # 判断详细原因
     if on_holiday:
@@ -148,19 +273,154 @@ def get_date_status(target_date: date) -> dict:
         detail = "正常工作日"
     else:
         detail = "周末"
+    return (
+        is_work, on_holiday, holiday_name, WEEKDAY_NAMES[weekday], d.isoformat(), detail
+    )
+
+
+@lru_cache(maxsize=4096)
+def _status_entry_cached(ordinal: int) -> tuple:
+    """状态表范围外的日期按序数缓存"""
+    return _build_status_entry(date.fromordinal(ordinal))
+
+
+# 当前年份及下一年的预计算状态表：
+# 序数 -> (是否工作日, 是否节假日, 节日名称, 星期, ISO 日期, 详细原因)
+_STATUS_TABLE: dict[int, tuple] = {}
+# 状态表内每一天之后的第一个休息日序数，表末尾无法确定的日期不收录
+_NEXT_REST_TABLE: dict[int, int] = {}
+
+
+def rebuild_status_table():
+    """预计算当前年份及下一年每一天的工作日状态"""
+    global _STATUS_TABLE, _NEXT_REST_TABLE
+    current_year = today().year
+    table = {}
+    for year in [current_year, current_year + 1]:
+        start = date(year, 1, 1).toordinal()
+        end = date(year, 12, 31).toordinal()
+        try:
+            for ordinal in range(start, end + 1):
+                table[ordinal] = _build_status_entry(date.fromordinal(ordinal))
+        except NotImplementedError:
+            logger.info("chinesecalendar 尚未收录 %d 年数据，跳过预计算", year)
+    # 倒序扫描一遍，携带最近的休息日
+    next_rest = {}
+    carry = None
+    for ordinal in sorted(table, reverse=True):
+        if ordinal + 1 not in table:
+            carry = None
+        if carry is not None:
+            next_rest[ordinal] = carry
+        if not table[ordinal][0]:
+            carry = ordinal
+    # 整体替换，避免请求读到构建到一半的表
+    _STATUS_TABLE, _NEXT_REST_TABLE = table, next_rest
+    _date_status_cached.cache_clear()
+    _next_rest_day_cached.cache_clear()
+    clear_response_cache()
+    logger.info("工作日状态表已重建，共 %d 天", len(table))
+
+
+async def scheduled_rebuild_status_table():
+    """定时重建状态表
+
+    APScheduler 会把普通函数放到线程池执行，协程则在事件循环中运行，
+    保证状态表替换和缓存清理不会与请求交错。
+    """
+    rebuild_status_table()
+
+
+def lookup_status(ordinal: int) -> tuple:
+    """查询状态表条目，超出预计算范围时回退到库查询"""
+    status = _STATUS_TABLE.get(ordinal)
+    if status is None:
+        status = _status_entry_cached(ordinal)
+    return status
+
+
+def clear_status_caches():
+    """chinesecalendar 重载后清空所有派生缓存"""
+    _status_entry_cached.cache_clear()
+    _date_status_cached.cache_clear()
+    _next_rest_day_cached.cache_clear()
+    clear_response_cache()
+
+
+def find_next_rest_day(from_date: date, max_days: int = 30) -> dict | None:
+    """从指定日期开始，查找下一个休息日"""
+    rest_day = _next_rest_day_cached(from_date.toordinal(), today_ordinal(), max_days)
+    return dict(rest_day) if rest_day else None
+
+
+@lru_cache(maxsize=64)
+def _next_rest_day_cached(base: int, today_ord: int, max_days: int) -> dict | None:
+    """按 (起始日期, 今天) 缓存下一个休息日，同一天内所有请求共享结果"""
+    rest = _NEXT_REST_TABLE.get(base)
+    if rest is not None:
+        if rest - base > max_days:
+            return None
+        return _rest_day_payload(rest, _STATUS_TABLE[rest], today_ord)
+
+    # 超出预计算范围时逐天查找
+    table_get = _STATUS_TABLE.get
+    for ordinal in range(base + 1, base + max_days + 1):
+        status = table_get(ordinal)
+        if status is None:
+            try:
+                status = lookup_status(ordinal)
+            except NotImplementedError:
+                break
+        if not status[0]:
+            return _rest_day_payload(ordinal, status, today_ord)
+    return None
+
+
+def _rest_day_payload(ordinal: int, status: tuple, today_ord: int) -> dict:
+    _, on_holiday, holiday_name, weekday_name, date_str, _ = status
+    return {
+        "date": date_str,
+        "weekday": weekday_name,
+        "detail": holiday_name if on_holiday and holiday_name else "周末",
+        "days_from_now": ordinal - today_ord,
+    }
+
+
+def parse_date(text: str) -> date | None:
+    """解析日期字符串，格式不正确或日期不存在时返回 None"""
+    m = _DATE_RE.fullmatch(text)
+    if m is None:
+        return None
+    try:
+        return date(int(m[1]), int(m[3] or m[5]), int(m[4] or m[6]))
+    except ValueError:
+        return None
+
+
+def get_date_status(target_date: date, *, include_next_rest: bool = False) -> dict:
+    """获取指定日期的工作日状态，include_next_rest 为 True 时附带下一个休息日"""
+    get_cache()
+    # 返回副本，调用方可以安全地修改
+    status = dict(_date_status_cached(target_date.toordinal(), _CACHE_MTIME))
+    if include_next_rest:
+        status["next_rest_day"] = find_next_rest_day(target_date)
+    return status
+
+
+@lru_cache(maxsize=1024)
+def _date_status_cached(ordinal: int, cache_mtime: float) -> dict:
+    """构建日期状态，按 (日期, 辅助源缓存版本) 缓存"""
+    status = lookup_status(ordinal)
+    is_work, on_holiday, holiday_name, weekday_name, date_str, detail = status
 
     # 辅助源比对
+    # 没有辅助源数据的年份（_NAGER_SETS 只保存非空年份）直接跳过
     warning = None
-    cache = load_cache()
-    year_cache = cache.get(str(target_date.year), {})
-    date_str = target_date.isoformat()
-
-    if year_cache:
-        in_nager = date_str in year_cache
+    year = int(date_str[:4])
+    if year in _NAGER_SETS:
+        in_nager = ordinal in _NAGER_SETS[year]
         # Nager 只包含公共假日，如果主源说是假日但辅助源没有，或反过来，给出提示
-        if on_holiday and not in_nager:
-            warning = "数据源存在差异，请以官方通知为准"
-        elif not on_holiday and in_nager:
+        if on_holiday != in_nager:
             warning = "数据源存在差异，请以官方通知为准"
 
     result = {
@@ -168,7 +428,6 @@ def get_date_status(target_date: date) -> dict:
         "weekday": weekday_name,
         "is_workday": is_work,
         "detail": detail,
-        "next_rest_day": find_next_rest_day(target_date),
         "warning": warning,
     }
     if on_holiday and holiday_name:
@@ -183,15 +442,28 @@ scheduler = AsyncIOScheduler(timezone="Asia/Shanghai")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 启动时更新辅助源缓存
-    await update_auxiliary_cache()
-    # 每天凌晨 4:00 执行更新
-    scheduler.add_job(update_library, "cron", hour=4, minute=0)
-    scheduler.add_job(update_auxiliary_cache, "cron", hour=4, minute=5)
+    # 复用同一个 HTTP 客户端，保持连接池
+    app.state.http = httpx.AsyncClient(
+        timeout=10, headers={"user-agent": "china-workday-api"}
+    )
+    # 启动时加载最新的 wheel，预计算状态表并更新辅助源缓存
+    await update_library()
+    rebuild_status_table()
+    await update_auxiliary_cache(app.state.http)
+    # 每 10 分钟检查 updater 是否下载了新的 wheel
+    scheduler.add_job(update_library, "interval", minutes=10)
+    # 每天凌晨 4:05 更新辅助源
+    scheduler.add_job(
+        update_auxiliary_cache, "cron", hour=4, minute=5, args=[app.state.http]
+    )
+    # 每天零点重建状态表，跨年时覆盖新的年份
+    scheduler.add_job(scheduled_rebuild_status_table, "cron", hour=0, minute=0)
+    scheduler.add_job(prerender_responses, "cron", hour=0, minute=1)
     scheduler.start()
-    logger.info("定时任务已启动，每天 04:00 自动更新")
+    logger.info("定时任务已启动")
     yield
     scheduler.shutdown()
+    await app.state.http.aclose()
 
 
 app = FastAPI(
@@ -205,76 +477,132 @@ app = FastAPI(
 )
 
 
+# 跳转地址固定，省去 RedirectResponse 每次的 URL 转义；
+# 不共享 Response 实例，中间件可能原地修改其 headers
+_DOCS_REDIRECT_HEADERS = {"location": "https://api.dyxcloud.com/workday/docs"}
+
+
 @app.get("/workday")
-def workday_index():
-    return RedirectResponse(url="https://api.dyxcloud.com/workday/docs")
+async def workday_index():
+    return Response(status_code=307, headers=_DOCS_REDIRECT_HEADERS)
 
 
-@app.get("/workday/check")
-def check_default():
-    """默认返回今天和明天的工作日状态"""
-    today = date.today()
-    tomorrow = today + timedelta(days=1)
-    today_status = get_date_status(today)
-    tomorrow_status = get_date_status(tomorrow)
-    today_status.pop("next_rest_day", None)
-    tomorrow_status.pop("next_rest_day", None)
+def _check_default_payload() -> dict:
+    today_date = today()
+    tomorrow = today_date + timedelta(days=1)
     return {
-        "today": today_status,
-        "tomorrow": tomorrow_status,
-        "next_rest_day": find_next_rest_day(today),
+        "today": get_date_status(today_date),
+        "tomorrow": get_date_status(tomorrow),
+        "next_rest_day": find_next_rest_day(today_date),
     }
 
 
-@app.get("/workday/check/today")
-def check_today():
-    """返回今天的工作日状态"""
-    today = date.today()
-    status = get_date_status(today)
-    status.pop("next_rest_day", None)
+def _check_today_payload() -> dict:
+    today_date = today()
     return {
-        "today": status,
-        "next_rest_day": find_next_rest_day(today),
+        "today": get_date_status(today_date),
+        "next_rest_day": find_next_rest_day(today_date),
     }
 
 
-@app.get("/workday/check/tomorrow")
-def check_tomorrow():
-    """返回明天的工作日状态"""
-    today = date.today()
-    tomorrow = today + timedelta(days=1)
-    status = get_date_status(tomorrow)
-    status.pop("next_rest_day", None)
+def _check_tomorrow_payload() -> dict:
+    today_date = today()
+    tomorrow = today_date + timedelta(days=1)
     return {
-        "tomorrow": status,
-        "next_rest_day": find_next_rest_day(today),
+        "tomorrow": get_date_status(tomorrow),
+        "next_rest_day": find_next_rest_day(today_date),
     }
 
 
+# 只依赖"今天"的接口，响应体整天不变，直接缓存编码后的字节
+_RESPONSE_BUILDERS = {
+    "default": _check_default_payload,
+    "today": _check_today_payload,
+    "tomorrow": _check_tomorrow_payload,
+}
+_RESPONSE_BYTES: dict[str, bytes] = {}
+_RESPONSE_KEY: tuple[int, float] = (0, 0.0)
+
+
+def clear_response_cache():
+    _RESPONSE_BYTES.clear()
+
+
+def cached_response(name: str) -> Response:
+    """返回预编码的响应，今天或辅助源缓存变化时重新生成"""
+    global _RESPONSE_KEY
+    get_cache()
+    key = (today_ordinal(), _CACHE_MTIME)
+    if key != _RESPONSE_KEY:
+        _RESPONSE_BYTES.clear()
+        _RESPONSE_KEY = key
+    body = _RESPONSE_BYTES.get(name)
+    if body is None:
+        body = _RESPONSE_BYTES[name] = orjson.dumps(_RESPONSE_BUILDERS[name]())
+    return Response(content=body, media_type=CJKResponse.media_type)
+
+
+async def prerender_responses():
+    """零点过后预先生成当天的响应
+
+    定义为协程，使其在事件循环中运行，不会与请求并发读写响应缓存。
+    """
+    for name in _RESPONSE_BUILDERS:
+        cached_response(name)
+
+
+@app.get("/workday/check")
+async def check_default():
+    """默认返回今天和明天的工作日状态"""
+    return cached_response("default")
+
+
+@app.get("/workday/check/today")
+async def check_today():
+    """返回今天的工作日状态"""
+    return cached_response("today")
+
+
+@app.get("/workday/check/tomorrow")
+async def check_tomorrow():
+    """返回明天的工作日状态"""
+    return cached_response("tomorrow")
+
+
+class BatchRequest(BaseModel):
+    dates: list[str] = Field(max_length=1000)
+
+
+@app.post("/workday/check/batch")
+async def check_batch(req: BatchRequest):
+    """批量查询多个日期是否为工作日，单次最多 1000 个，日期格式同单日查询"""
+    results = []
+    for text in req.dates:
+        d = parse_date(text)
+        if d is None:
+            raise HTTPException(status_code=400, detail=f"日期格式错误：{text}")
+        try:
+            results.append(get_date_status(d))
+        except NotImplementedError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"暂不支持查询 {d.year} 年的数据，chinesecalendar 库尚未收录",
+            )
+    return CJKResponse({
+        "results": results,
+        "next_rest_day": find_next_rest_day(today()),
+    })
+
+
 @app.get("/workday/check/{target_date}")
-def check_date(target_date: str):
+async def check_date(target_date: str):
     """查询指定日期是否为工作日，支持多种格式：
     - 2026-02-25、2026-2-25
     - 2026_02_25、2026_2_25
     - 20260225
     - 2026年02月25日、2026年2月25日
     """
-    # 支持的日期格式列表
-    formats = [
-        "%Y-%m-%d", "%Y-%-m-%-d",
-        "%Y_%m_%d", "%Y_%-m_%-d",
-        "%Y%m%d",
-        "%Y年%m月%d日", "%Y年%-m月%-d日",
-    ]
-
-    d = None
-    for fmt in formats:
-        try:
-            d = datetime.strptime(target_date, fmt).date()
-            break
-        except ValueError:
-            continue
-
+    d = parse_date(target_date)
     if d is None:
         raise HTTPException(
             status_code=400,
@@ -283,11 +611,10 @@ def check_date(target_date: str):
 
     try:
         status = get_date_status(d)
-        status.pop("next_rest_day", None)
-        return {
+        return CJKResponse({
             "date": status,
-            "next_rest_day": find_next_rest_day(date.today()),
-        }
+            "next_rest_day": find_next_rest_day(today()),
+        })
     except NotImplementedError:
         raise HTTPException(
             status_code=400,
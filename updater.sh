@@ -0,0 +1,24 @@
+#!/bin/sh
+# 定期下载最新的 chinese-calendar wheel 到共享目录，API 容器检测到新文件后自动重载
+
+WHEEL_DIR=/app/wheels
+STAGING_DIR="$WHEEL_DIR/.staging"
+
+while true; do
+    echo "==> 下载最新 chinese-calendar wheel..."
+    mkdir -p "$STAGING_DIR"
+    if pip download --no-deps --only-binary=:all: --no-cache-dir chinese-calendar -q \
+        -d "$STAGING_DIR" \
+        -i https://mirrors.aliyun.com/pypi/simple/ \
+        --trusted-host mirrors.aliyun.com; then
+        # 同一文件系统内 mv 为原子操作，API 不会读到写了一半的 wheel
+        for wheel in "$STAGING_DIR"/*.whl; do
+            [ -e "$wheel" ] || continue
+            [ -e "$WHEEL_DIR/$(basename "$wheel")" ] || mv "$wheel" "$WHEEL_DIR/"
+        done
+        echo "==> 下载完成"
+    else
+        echo "==> 下载失败，下次重试"
+    fi
+    sleep 86400
+done